@@ -2,23 +2,44 @@
 from __future__ import annotations
 
 import argparse
+import base64
 import calendar
+import functools
 import html
+import http.client
 import http.server
 import json
 import os
 import random
+import select
 import ssl
 import sys
 import threading
 import time
 import webbrowser
-import urllib.error
 import urllib.parse
 import urllib.request
-from dataclasses import dataclass
-from datetime import date, datetime, time as dt_time, timedelta, timezone
-from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+# Both parsers accept bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError.
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
 
 def load_env_file(file_path: str = ".env") -> None:
     try:
@@ -62,6 +83,11 @@ DEFAULT_TASK_DAYS_RANGE = parse_positive_int_env("DEFAULT_TASK_DAYS_RANGE", 60)
 GUI_PORT = parse_positive_int_env("GUI_PORT", 8080)
 INSECURE_SSL_CONTEXT = ssl._create_unverified_context()
 DATE_INPUT_FORMAT = "%d.%m.%Y"
+MAX_FETCH_WORKERS = 8
+DEFAULT_POST_WORKERS = 4
+RNG = random.Random()
+HTTP_TIMEOUT_SECONDS = 30
+HTTP_POOL_MAXSIZE = 16
 
 
 @dataclass
@@ -71,6 +97,30 @@ class Issue:
     weight: int
 
 
+@dataclass
+class JiraClient:
+    base_url: str
+    headers: Mapping[str, str]
+    search_url: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.base_url = self.base_url.rstrip("/")
+        self.search_url = f"{self.base_url}/rest/api/2/search"
+
+    def worklog_url(self, issue_key: str) -> str:
+        return f"{self.base_url}/rest/api/2/issue/{issue_key}/worklog"
+
+
+def parse_positive_int_arg(raw_value: str) -> int:
+    try:
+        parsed = int(raw_value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {raw_value!r}") from None
+    if parsed < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return parsed
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate Jira worklogs by weighted random distribution."
@@ -100,140 +150,291 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Start web interface instead of CLI.",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=parse_positive_int_arg,
+        default=DEFAULT_POST_WORKERS,
+        help=(
+            "Parallel worklog POSTs per day (one issue per worker); "
+            "lower it if Jira rate-limits."
+        ),
+    )
     return parser.parse_args()
 
 
-def make_headers(token: str) -> dict[str, str]:
+@functools.lru_cache(maxsize=None)
+def make_headers(token: str) -> Mapping[str, str]:
+    # Read-only, so one cached mapping per token is shared by every request and thread.
     if not token:
         raise ValueError(
             "Jira token is empty. Pass --token or set DEFAULT_TOKEN in .env."
         )
-    return {
+    return MappingProxyType({
         "Authorization": f"Bearer {token}",
         "Accept": "application/json",
         "Content-Type": "application/json",
-    }
+        "Connection": "keep-alive",
+    })
+
+
+_connection_pool: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_connection_pool_lock = threading.Lock()
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+
+def _proxy_for(scheme: str, host: str) -> urllib.parse.SplitResult | None:
+    # Honour HTTP(S)_PROXY / NO_PROXY the same way urlopen does.
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    return urllib.parse.urlsplit(proxy_url)
+
+
+def _proxy_auth_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    if not proxy.username:
+        return {}
+    username = urllib.parse.unquote(proxy.username)
+    password = urllib.parse.unquote(proxy.password or "")
+    token = base64.b64encode(f"{username}:{password}".encode()).decode()
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _open_connection(parsed: urllib.parse.SplitResult) -> http.client.HTTPConnection:
+    proxy = _proxy_for(parsed.scheme, parsed.hostname or "")
+    if parsed.scheme == "https":
+        if proxy is None:
+            return http.client.HTTPSConnection(
+                parsed.netloc, timeout=HTTP_TIMEOUT_SECONDS, context=INSECURE_SSL_CONTEXT
+            )
+        connection: http.client.HTTPConnection = http.client.HTTPSConnection(
+            proxy.hostname,
+            proxy.port,
+            timeout=HTTP_TIMEOUT_SECONDS,
+            context=INSECURE_SSL_CONTEXT,
+        )
+        connection.set_tunnel(parsed.hostname, parsed.port, headers=_proxy_auth_headers(proxy))
+        return connection
+    if proxy is None:
+        return http.client.HTTPConnection(parsed.netloc, timeout=HTTP_TIMEOUT_SECONDS)
+    return http.client.HTTPConnection(proxy.hostname, proxy.port, timeout=HTTP_TIMEOUT_SECONDS)
+
+
+def _acquire_connection(
+    parsed: urllib.parse.SplitResult,
+) -> tuple[http.client.HTTPConnection, bool]:
+    """Return a live idle pooled connection (reused=True) or open a new one."""
+    while True:
+        with _connection_pool_lock:
+            idle = _connection_pool.get((parsed.scheme, parsed.netloc))
+            if not idle:
+                break
+            connection = idle.pop()
+        if not _is_connection_dropped(connection):
+            return connection, True
+        connection.close()
+    return _open_connection(parsed), False
+
+
+def _is_connection_dropped(connection: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket should have nothing to read; readable means the
+    # server closed it (EOF) or sent something unexpected, so it cannot be reused.
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _release_connection(
+    parsed: urllib.parse.SplitResult, connection: http.client.HTTPConnection
+) -> None:
+    with _connection_pool_lock:
+        idle = _connection_pool.setdefault((parsed.scheme, parsed.netloc), [])
+        if len(idle) < HTTP_POOL_MAXSIZE:
+            idle.append(connection)
+            return
+    connection.close()
+
+
+def _send_request(
+    method: str, url: str, headers: Mapping[str, str], data: bytes | None
+) -> tuple[http.client.HTTPResponse, bytes]:
+    parsed = urllib.parse.urlsplit(url)
+    request_headers = dict(headers)
+    if parsed.scheme == "http" and (proxy := _proxy_for("http", parsed.hostname or "")):
+        # Plain-HTTP proxies take the absolute URL as the request target.
+        target = url
+        request_headers.update(_proxy_auth_headers(proxy))
+    else:
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+    connection, reused = _acquire_connection(parsed)
+    try:
+        try:
+            connection.request(method, target, body=data, headers=request_headers)
+            response = connection.getresponse()
+            raw_body = response.read()
+        except (ConnectionResetError, BrokenPipeError):
+            connection.close()
+            # An idle pooled connection may have been dropped by the server. Only GET is
+            # replayed, on a newly opened connection: a POST may already have been applied.
+            if not (reused and method == "GET"):
+                raise
+            connection = _open_connection(parsed)
+            connection.request(method, target, body=data, headers=request_headers)
+            response = connection.getresponse()
+            raw_body = response.read()
+    except (OSError, http.client.HTTPException) as exc:
+        connection.close()
+        raise RuntimeError(f"Request failed: {method} {url}: {exc}") from exc
+
+    if response.will_close:
+        connection.close()
+    else:
+        _release_connection(parsed, connection)
+    return response, raw_body
 
 
 def request_json(
     method: str,
     url: str,
-    headers: dict[str, str],
-    params: dict[str, Any] | None = None,
+    headers: Mapping[str, str],
     body: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    if params:
-        query = urllib.parse.urlencode(params)
-        url = f"{url}?{query}"
-
     data: bytes | None = None
     if body is not None:
-        data = json.dumps(body).encode("utf-8")
-
-    request = urllib.request.Request(url=url, data=data, method=method, headers=headers)
-    try:
-        with urllib.request.urlopen(
-            request, timeout=30, context=INSECURE_SSL_CONTEXT
-        ) as response:
-            raw_body = response.read()
-    except urllib.error.HTTPError as exc:
-        response_text = exc.read().decode("utf-8", errors="replace")
+        data = _json_dumps(body)
+
+    response, raw_body = _send_request(method, url, headers, data)
+    # Follow redirects for GET like urlopen does; other methods surface them as errors.
+    redirects = 0
+    while (
+        method == "GET"
+        and response.status in REDIRECT_STATUSES
+        and response.getheader("Location")
+        and redirects < MAX_REDIRECTS
+    ):
+        redirects += 1
+        url = urllib.parse.urljoin(url, response.getheader("Location"))
+        response, raw_body = _send_request(method, url, headers, data)
+
+    if response.status >= 300:
+        response_text = raw_body.decode("utf-8", errors="replace")
         raise RuntimeError(
-            f"HTTP {exc.code} for {method} {url}: {response_text[:500]}"
-        ) from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"Request failed: {method} {url}: {exc}") from exc
+            f"HTTP {response.status} for {method} {url}: {response_text[:500]}"
+        )
     try:
         if not raw_body:
             return {}
-        return json.loads(raw_body.decode("utf-8"))
+        return _json_loads(raw_body)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Non-JSON response for {method} {url}") from exc
 
 
-def fetch_open_issues(
-    headers: dict[str, str], base_url: str, task_days_range: int
-) -> list[dict[str, Any]]:
-    url = f"{base_url.rstrip('/')}/rest/api/2/search"
+SEARCH_PAGE_SIZE = 100
+
+
+def _search_all_issues(client: JiraClient, params: dict[str, Any]) -> list[dict[str, Any]]:
+    # The JQL dominates urlencode cost, so encode the static query once and append offsets.
+    base_query = f"{client.search_url}?{urllib.parse.urlencode(params)}"
+
+    def fetch_page(start_at: int, page_size: int) -> dict[str, Any]:
+        return request_json(
+            "GET", f"{base_query}&startAt={start_at}&maxResults={page_size}", client.headers
+        )
+
+    # The first page reports the total, so the remaining pages can be fetched in parallel.
+    first_page = fetch_page(0, SEARCH_PAGE_SIZE)
+    issues: list[dict[str, Any]] = list(first_page.get("issues", []))
+    total = first_page.get("total", len(issues))
+    page_size = first_page.get("maxResults") or SEARCH_PAGE_SIZE
+    offsets = range(page_size, total, page_size)
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(offsets))) as executor:
+            for payload in executor.map(lambda start_at: fetch_page(start_at, page_size), offsets):
+                issues.extend(payload.get("issues", []))
+
+    # Jira's total may drift between requests; pick up any tail sequentially.
+    while len(issues) < total:
+        payload = fetch_page(len(issues), page_size)
+        page_items = payload.get("issues", [])
+        if not page_items:
+            break
+        issues.extend(page_items)
+        total = payload.get("total", total)
+    return issues
+
+
+def fetch_open_issues(client: JiraClient, task_days_range: int) -> list[dict[str, Any]]:
     params = {
         "jql": (
             "assignee=currentUser() AND statusCategory!=Done "
             f"AND created>=-{task_days_range}d ORDER BY created DESC"
         ),
         "fields": "key,summary,description,creator,created,status",
-        "startAt": 0,
-        "maxResults": 100,
     }
-    issues: list[dict[str, Any]] = []
-    while True:
-        payload = request_json("GET", url, headers, params=params)
-        page_items = payload.get("issues", [])
-        issues.extend(page_items)
-        start_at = payload.get("startAt", 0)
-        max_results = payload.get("maxResults", len(page_items))
-        total = payload.get("total", len(page_items))
-        if start_at + max_results >= total:
-            break
-        params["startAt"] = start_at + max_results
-    return issues
+    return _search_all_issues(client, params)
 
 
-def fetch_day_issue_keys(
-    headers: dict[str, str], base_url: str, day_iso: str
-) -> list[str]:
-    url = f"{base_url.rstrip('/')}/rest/api/2/search"
-    params = {
-        "jql": f'worklogAuthor=currentUser() AND worklogDate="{day_iso}"',
-        "expand": "worklog",
-        "fields": "key",
-        "startAt": 0,
-        "maxResults": 100,
-    }
-    keys: list[str] = []
-    while True:
-        payload = request_json("GET", url, headers, params=params)
-        for issue in payload.get("issues", []):
-            key = issue.get("key")
-            if key:
-                keys.append(key)
-        start_at = payload.get("startAt", 0)
-        max_results = payload.get("maxResults", 0)
-        total = payload.get("total", len(keys))
-        if start_at + max_results >= total:
-            break
-        params["startAt"] = start_at + max_results
-    return keys
+def fetch_current_user_name(client: JiraClient) -> str:
+    payload = request_json("GET", f"{client.base_url}/rest/api/2/myself", client.headers)
+    return payload.get("name") or ""
+
+
+def fetch_worklog_issues(client: JiraClient, jql: str) -> list[dict[str, Any]]:
+    """Search issues with their worklogs embedded, so most need no per-issue request."""
+    return _search_all_issues(client, {"jql": jql, "fields": "worklog"})
+
+
+def _worklog_entries(worklogs: list[dict[str, Any]], author: str) -> list[tuple[str, int]]:
+    entries: list[tuple[str, int]] = []
+    for worklog in worklogs:
+        if author and (worklog.get("author") or {}).get("name") != author:
+            continue
+        started = worklog.get("started")
+        seconds = int(worklog.get("timeSpentSeconds", 0) or 0)
+        if started and seconds > 0:
+            entries.append((started, seconds))
+    return entries
 
 
 def fetch_issue_worklogs(
-    headers: dict[str, str], base_url: str, issue_key: str
-) -> list[dict[str, Any]]:
-    url = f"{base_url.rstrip('/')}/rest/api/2/issue/{issue_key}/worklog"
+    client: JiraClient,
+    issue_key: str,
+    author: str = "",
+    started_after_ms: int | None = None,
+    started_before_ms: int | None = None,
+) -> list[tuple[str, int]]:
+    """Return (started, timeSpentSeconds) pairs; full worklog dicts are dropped page by page."""
+    url = f"{client.worklog_url(issue_key)}?maxResults=100"
+    if started_after_ms is not None:
+        url = f"{url}&startedAfter={started_after_ms}"
+    if started_before_ms is not None:
+        url = f"{url}&startedBefore={started_before_ms}"
     start_at = 0
-    max_results = 100
-    all_logs: list[dict[str, Any]] = []
+    entries: list[tuple[str, int]] = []
     while True:
-        payload = request_json(
-            "GET", url, headers, params={"startAt": start_at, "maxResults": max_results}
-        )
+        payload = request_json("GET", f"{url}&startAt={start_at}", client.headers)
         logs = payload.get("worklogs", [])
-        all_logs.extend(logs)
-        total = payload.get("total", len(all_logs))
+        entries.extend(_worklog_entries(logs, author))
+        total = payload.get("total", start_at + len(logs))
         returned = payload.get("maxResults", len(logs))
         if start_at + returned >= total:
             break
         start_at += returned
-    return all_logs
+    return entries
 
 
-def post_worklog(
-    headers: dict[str, str],
-    base_url: str,
-    issue_key: str,
-    payload: dict[str, Any],
-) -> None:
-    url = f"{base_url.rstrip('/')}/rest/api/2/issue/{issue_key}/worklog"
-    request_json("POST", url, headers, body=payload)
+def post_worklog(client: JiraClient, issue_key: str, payload: dict[str, Any]) -> None:
+    request_json("POST", client.worklog_url(issue_key), client.headers, body=payload)
 
 
 def subtract_one_month(today: date) -> date:
@@ -330,52 +531,141 @@ def print_issues_table(issues: list[tuple[str, str]]) -> None:
     print(separator)
 
 
-def parse_started_datetime(started: str) -> datetime:
+def parse_started_date(started: str) -> date:
     # Jira value example: 2026-02-23T10:00:00.000+0300
-    return datetime.strptime(started, "%Y-%m-%dT%H:%M:%S.%f%z")
-
+    # The local calendar date is the leading YYYY-MM-DD, so only that part is parsed.
+    if len(started) < 10 or started[4] != "-" or started[7] != "-":
+        raise ValueError(f"Invalid started value: {started!r}")
+    return date(int(started[0:4]), int(started[5:7]), int(started[8:10]))
+
+
+def _started_window_ms(start_date: date, end_date: date) -> tuple[int, int]:
+    # Padded by a day on each side so any worklog time zone offset stays inside the window.
+    after = datetime.combine(start_date - timedelta(days=1), datetime.min.time(), timezone.utc)
+    before = datetime.combine(end_date + timedelta(days=2), datetime.min.time(), timezone.utc)
+    return int(after.timestamp()) * 1000, int(before.timestamp()) * 1000
+
+
+def _fetch_worklogs_by_key(
+    client: JiraClient,
+    keys: set[str],
+    author: str,
+    window_ms: tuple[int, int],
+) -> dict[str, list[tuple[str, int]]]:
+    worklogs_by_key: dict[str, list[tuple[str, int]]] = {}
+    started_after_ms, started_before_ms = window_ms
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(keys))) as executor:
+        futures = {
+            executor.submit(
+                fetch_issue_worklogs, client, key, author, started_after_ms, started_before_ms
+            ): key
+            for key in keys
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                worklogs_by_key[key] = future.result()
+            except RuntimeError as exc:
+                print(f"[WARN] Failed to fetch worklog for {key}: {exc}")
+    return worklogs_by_key
 
-def calculate_logged_seconds_for_day(
-    headers: dict[str, str], base_url: str, day: date
-) -> int:
-    day_iso = day.isoformat()
-    keys = fetch_day_issue_keys(headers, base_url, day_iso)
-    if not keys:
-        return 0
 
-    total_seconds = 0
-    seen: set[str] = set()
-    for key in keys:
-        if key in seen:
-            continue
-        seen.add(key)
-        try:
-            worklogs = fetch_issue_worklogs(headers, base_url, key)
-        except RuntimeError as exc:
-            print(f"[WARN] Failed to fetch worklog for {key}: {exc}")
-            continue
-        for worklog in worklogs:
-            started = worklog.get("started")
-            seconds = int(worklog.get("timeSpentSeconds", 0) or 0)
-            if not started or seconds <= 0:
-                continue
+def _iter_worklog_days(
+    worklogs_by_key: dict[str, list[tuple[str, int]]]
+) -> Iterator[tuple[date, int]]:
+    for worklogs in worklogs_by_key.values():
+        for started, seconds in worklogs:
             try:
-                started_dt = parse_started_datetime(started)
+                started_day = parse_started_date(started)
             except ValueError:
                 continue
-            if started_dt.date() == day:
-                total_seconds += seconds
-    return total_seconds
+            yield started_day, seconds
+
+
+def _collect_worklogs(
+    client: JiraClient,
+    jql: str,
+    window_ms: tuple[int, int],
+) -> dict[str, list[tuple[str, int]]]:
+    author = fetch_current_user_name(client)
+    worklogs_by_key: dict[str, list[tuple[str, int]]] = {}
+    truncated_keys: set[str] = set()
+    for issue in fetch_worklog_issues(client, jql):
+        key = issue.get("key")
+        if not key:
+            continue
+        embedded = (issue.get("fields") or {}).get("worklog") or {}
+        logs = embedded.get("worklogs", [])
+        # Search embeds only the first page of worklogs; fetch the rest per issue.
+        if embedded.get("total", len(logs)) > len(logs):
+            truncated_keys.add(key)
+        else:
+            worklogs_by_key[key] = _worklog_entries(logs, author)
+    if truncated_keys:
+        worklogs_by_key.update(
+            _fetch_worklogs_by_key(client, truncated_keys, author, window_ms)
+        )
+    return worklogs_by_key
+
+
+def calculate_logged_seconds_by_day(
+    client: JiraClient, start_date: date, end_date: date
+) -> dict[date, int]:
+    """Sum logged seconds per day for the whole range with a single JQL search."""
+    jql = (
+        "worklogAuthor=currentUser() "
+        f'AND worklogDate>="{start_date.isoformat()}" '
+        f'AND worklogDate<="{end_date.isoformat()}"'
+    )
+    logged_by_day: dict[date, int] = {}
+    worklogs_by_key = _collect_worklogs(client, jql, _started_window_ms(start_date, end_date))
+    for started_day, seconds in _iter_worklog_days(worklogs_by_key):
+        if start_date <= started_day <= end_date:
+            logged_by_day[started_day] = logged_by_day.get(started_day, 0) + seconds
+    return logged_by_day
 
 
 def working_days(start_date: date, end_date: date) -> list[date]:
-    days: list[date] = []
-    current = start_date
-    while current <= end_date:
-        if current.weekday() < 5:
-            days.append(current)
-        current += timedelta(days=1)
-    return days
+    # Walk whole weeks from the Monday on/before start_date, emitting Mon-Fri ordinals.
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    first_monday = start_ordinal - start_date.weekday()
+    return [
+        date.fromordinal(ordinal)
+        for week_start in range(first_monday, end_ordinal + 1, 7)
+        for ordinal in range(max(week_start, start_ordinal), min(week_start + 5, end_ordinal + 1))
+    ]
+
+
+class AliasTable:
+    """Vose alias table for O(1) weighted sampling of indices."""
+
+    def __init__(self, weights: list[int]) -> None:
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def pick(self, uniform: float) -> int:
+        # One uniform in [0, 1): the integer part of u*n picks the column,
+        # the fractional part flips that column's coin.
+        n = len(self.prob)
+        scaled = uniform * n
+        i = min(int(scaled), n - 1)
+        return i if scaled - i < self.prob[i] else self.alias[i]
 
 
 def build_day_payloads(
@@ -383,32 +673,39 @@ def build_day_payloads(
     issues: list[Issue],
     remaining_seconds: int,
     max_task_hours: int,
+    alias_table: AliasTable | None = None,
+    rng: random.Random | None = None,
 ) -> list[tuple[str, dict[str, Any]]]:
     hour_seconds = 3600
     max_chunk_seconds = max_task_hours * hour_seconds
     issue_keys = [x.key for x in issues]
-    issue_weights = [x.weight for x in issues]
+    if alias_table is None:
+        alias_table = AliasTable([x.weight for x in issues])
+    rng = rng or RNG
+    # Every chunk is at least one hour and consumes two uniforms, so this never runs short.
+    draws = iter([rng.random() for _ in range(2 * (remaining_seconds // hour_seconds))])
 
     payloads: list[tuple[str, dict[str, Any]]] = []
-    current_dt = datetime.combine(day, dt_time(hour=10, minute=0, second=0)).replace(
-        tzinfo=timezone(timedelta(hours=3))
-    )
+    # Chunks are whole hours from 10:00 MSK, so started is formatted from an hour counter.
+    current_hour = 10
 
     while remaining_seconds >= hour_seconds:
         max_allowed = min(max_chunk_seconds, remaining_seconds)
         max_hours = max_allowed // hour_seconds
-        chunk_hours = random.randint(1, max_hours)
+        chunk_hours = min(1 + int(next(draws) * max_hours), max_hours)
         chunk_seconds = chunk_hours * hour_seconds
-        issue_key = random.choices(issue_keys, weights=issue_weights, k=1)[0]
+        issue_key = issue_keys[alias_table.pick(next(draws))]
 
+        extra_days, hour_of_day = divmod(current_hour, 24)
+        started_day = day + timedelta(days=extra_days) if extra_days else day
         payload = {
             "comment": f"Work on task {issue_key}",
-            "started": current_dt.strftime("%Y-%m-%dT%H:%M:%S.000%z"),
+            "started": f"{started_day.isoformat()}T{hour_of_day:02d}:00:00.000+0300",
             "timeSpentSeconds": chunk_seconds,
         }
         payloads.append((issue_key, payload))
 
-        current_dt += timedelta(seconds=chunk_seconds)
+        current_hour += chunk_hours
         remaining_seconds -= chunk_seconds
 
     return payloads
@@ -443,9 +740,47 @@ def ask_confirmation() -> bool:
         print("Enter y or n.")
 
 
+def _post_issue_worklogs(
+    client: JiraClient, issue_key: str, payloads: list[dict[str, Any]]
+) -> tuple[int, int]:
+    created = 0
+    errors = 0
+    for payload in payloads:
+        try:
+            post_worklog(client, issue_key, payload)
+            created += 1
+        except RuntimeError:
+            errors += 1
+    return created, errors
+
+
+def post_day_worklogs(
+    client: JiraClient,
+    payloads: list[tuple[str, dict[str, Any]]],
+    max_workers: int = DEFAULT_POST_WORKERS,
+) -> tuple[int, int]:
+    """POST a day's worklogs in parallel across issues. Returns (created, errors)."""
+    # Entries for the same issue stay sequential so their started times never interleave.
+    payloads_by_key: dict[str, list[dict[str, Any]]] = {}
+    for issue_key, payload in payloads:
+        payloads_by_key.setdefault(issue_key, []).append(payload)
+
+    created = 0
+    errors = 0
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(payloads_by_key))) as executor:
+        futures = [
+            executor.submit(_post_issue_worklogs, client, issue_key, issue_payloads)
+            for issue_key, issue_payloads in payloads_by_key.items()
+        ]
+        for future in as_completed(futures):
+            issue_created, issue_errors = future.result()
+            created += issue_created
+            errors += issue_errors
+    return created, errors
+
+
 def run_timesheet(
-    headers: dict[str, str],
-    base_url: str,
+    client: JiraClient,
     weighted_issues: list[Issue],
     start_date: date,
     end_date: date,
@@ -453,6 +788,7 @@ def run_timesheet(
     max_task_hours: int,
     dry_run: bool = False,
     progress_callback: Callable[[date, int, int, int, int], None] | None = None,
+    max_workers: int = DEFAULT_POST_WORKERS,
 ) -> tuple[int, int, int]:
     """Run timesheet logic. Returns (created, skipped_days, errors)."""
     days = working_days(start_date, end_date)
@@ -463,42 +799,42 @@ def run_timesheet(
     skipped_days = 0
     errors = 0
 
-    for day in days:
-        try:
-            logged_seconds = calculate_logged_seconds_for_day(headers, base_url, day)
-        except RuntimeError:
+    try:
+        logged_by_day = calculate_logged_seconds_by_day(client, start_date, end_date)
+    except RuntimeError:
+        for day in days:
             errors += 1
             if progress_callback:
                 progress_callback(day, 0, created, skipped_days, errors)
-            continue
+        return created, skipped_days, errors
+
+    # Weekends are already excluded by working_days; full days are skipped without any request.
+    target_seconds = daily_hours * 3600
+    remaining_by_day = [(day, target_seconds - logged_by_day.get(day, 0)) for day in days]
 
-        target_seconds = daily_hours * 3600
-        remaining_seconds = target_seconds - logged_seconds
+    alias_table = AliasTable([x.weight for x in weighted_issues])
+    for day, remaining_seconds in remaining_by_day:
         if remaining_seconds < 3600:
             skipped_days += 1
             if progress_callback:
                 progress_callback(day, 0, created, skipped_days, errors)
             continue
 
-        payloads = build_day_payloads(day, weighted_issues, remaining_seconds, max_task_hours)
+        payloads = build_day_payloads(
+            day, weighted_issues, remaining_seconds, max_task_hours, alias_table
+        )
         if not payloads:
             skipped_days += 1
             if progress_callback:
                 progress_callback(day, 0, created, skipped_days, errors)
             continue
 
-        created_this_day = 0
-        for issue_key, payload in payloads:
-            if dry_run:
-                created += 1
-                created_this_day += 1
-                continue
-            try:
-                post_worklog(headers, base_url, issue_key, payload)
-                created += 1
-                created_this_day += 1
-            except RuntimeError:
-                errors += 1
+        if dry_run:
+            created_this_day = len(payloads)
+        else:
+            created_this_day, day_errors = post_day_worklogs(client, payloads, max_workers)
+            errors += day_errors
+        created += created_this_day
 
         if progress_callback:
             progress_callback(day, created_this_day, created, skipped_days, errors)
@@ -673,12 +1009,11 @@ _job_lock = threading.Lock()
 
 def run_gui() -> int:
     try:
-        headers = make_headers(DEFAULT_TOKEN)
+        client = JiraClient(DEFAULT_BASE_URL, make_headers(DEFAULT_TOKEN))
     except ValueError as exc:
         print(f"[ERROR] {exc}")
         return 1
 
-    base_url = DEFAULT_BASE_URL.rstrip("/")
     port = GUI_PORT
     url = f"http://127.0.0.1:{port}"
 
@@ -705,7 +1040,7 @@ def run_gui() -> int:
                 self.send_error(404)
                 return
             try:
-                raw_issues = fetch_open_issues(headers, base_url, DEFAULT_TASK_DAYS_RANGE)
+                raw_issues = fetch_open_issues(client, DEFAULT_TASK_DAYS_RANGE)
             except RuntimeError as exc:
                 body = _html_page(
                     "Timesheet Error",
@@ -789,8 +1124,7 @@ def run_gui() -> int:
 
                 try:
                     created, skipped_days, errors = run_timesheet(
-                        headers,
-                        base_url,
+                        client,
                         weighted_issues,
                         start_date,
                         end_date,
@@ -834,17 +1168,16 @@ def main() -> int:
     if args.gui:
         return run_gui()
     try:
-        headers = make_headers(args.token)
+        client = JiraClient(args.base_url, make_headers(args.token))
     except ValueError as exc:
         print(f"[ERROR] {exc}")
         return 1
 
-    base_url = args.base_url.rstrip("/")
     use_defaults = False if args.manager else ask_use_defaults()
 
     print(f"\nStep 1/5: loading open issues for the last {DEFAULT_TASK_DAYS_RANGE} days...")
     try:
-        raw_issues = fetch_open_issues(headers, base_url, DEFAULT_TASK_DAYS_RANGE)
+        raw_issues = fetch_open_issues(client, DEFAULT_TASK_DAYS_RANGE)
     except RuntimeError as exc:
         print(f"[ERROR] Failed to fetch issues: {exc}")
         return 1
@@ -915,14 +1248,14 @@ def main() -> int:
         return 0
 
     created, skipped_days, errors = run_timesheet(
-        headers,
-        base_url,
+        client,
         weighted_issues,
         start_date,
         end_date,
         daily_hours,
         max_task_hours,
         dry_run=args.dry_run,
+        max_workers=args.max_workers,
     )
 
     print("\n=== Result ===")